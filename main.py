@@ -19,30 +19,20 @@ load_dotenv()
 # Add src to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from src.shared.events import EventBus, console_event_handler
-from src.master.loop import MasterAgent
-from src.workers.runner import WorkerRunner
+from src.federation import Federation
+from src.shared.events import console_event_handler
 
 
-def main():
-    # Ensure workspace exists
+def create_federation() -> Federation:
+    """Create a federation that logs its events to the console."""
     workspace_path = os.path.join(os.path.dirname(__file__), "workspace")
-    os.makedirs(workspace_path, exist_ok=True)
-
-    # Create event bus with console handler
-    event_bus = EventBus()
-    event_bus.subscribe(console_event_handler)
+    federation = Federation(workspace_path=workspace_path)
+    federation.event_bus.subscribe(console_event_handler)
+    return federation
 
-    # Create master agent
-    master = MasterAgent(workspace_path=workspace_path)
-    master.event_bus = event_bus  # Share event bus
 
-    # Create worker runner and connect to master
-    worker_runner = WorkerRunner(
-        event_bus=event_bus,
-        workspace_path=workspace_path,
-    )
-    master.set_worker_runner(worker_runner)
+def main():
+    federation = create_federation()
 
     # Get user input
     if len(sys.argv) > 1:
@@ -59,7 +49,7 @@ def main():
     print("Processing...\n")
 
     # Run the master agent
-    response = master.run(user_message)
+    response = federation.run(user_message)
 
     print(f"\n{'=' * 40}")
     print("Final Response:")
@@ -68,20 +58,7 @@ def main():
 
 def interactive():
     """Run in interactive mode."""
-    workspace_path = os.path.join(os.path.dirname(__file__), "workspace")
-    os.makedirs(workspace_path, exist_ok=True)
-
-    event_bus = EventBus()
-    event_bus.subscribe(console_event_handler)
-
-    master = MasterAgent(workspace_path=workspace_path)
-    master.event_bus = event_bus
-
-    worker_runner = WorkerRunner(
-        event_bus=event_bus,
-        workspace_path=workspace_path,
-    )
-    master.set_worker_runner(worker_runner)
+    federation = create_federation()
 
     print("Agent Federation System - Interactive Mode")
     print("=" * 40)
@@ -97,7 +74,7 @@ def interactive():
         print(f"\n{'─' * 40}\n")
 
         try:
-            master.run(user_message)
+            federation.run(user_message)
             print(f"\n{'─' * 40}")
             print("Done.")
         except KeyboardInterrupt:
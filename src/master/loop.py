@@ -2,16 +2,44 @@
 
 from __future__ import annotations
 
-import anthropic
+import json
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-from ..shared.events import EventType, Event
+import anthropic
+
 from ..shared.types import MasterStatus
 from .tools import MASTER_TOOLS, ToolExecutor
 
 if TYPE_CHECKING:
     from ..federation import Federation
 
+# Use orjson for tool input parsing when available (its errors subclass json.JSONDecodeError)
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+
+# Streamed text is coalesced before being emitted so the event bus isn't hit per token
+TEXT_FLUSH_INTERVAL = 0.016  # seconds
+TEXT_FLUSH_CHARS = 64
+
+# Anthropic clients shared per API key so every MasterAgent reuses one connection pool
+_clients: dict[str | None, anthropic.Anthropic] = {}
+
+# Marks the end of a stream read by MasterAgent._read_stream
+_STREAM_END = object()
+
+# Upper bound on LLM calls per user message, guarding against runaway tool loops
+MAX_TURNS = 16
+
+# Conversation length (in messages) past which the oldest exchanges are dropped. It is
+# trimmed to about half, so the cached prompt prefix is only invalidated occasionally
+MAX_CONVERSATION_MESSAGES = 200
 
 MASTER_SYSTEM_PROMPT = """You are the Master Agent in an agent federation system.
 
@@ -39,6 +67,31 @@ Workflow for delegation:
 For simple questions, handle them directly without delegation.
 For complex tasks, delegate to specialized workers."""
 
+# System prompt as a cacheable block so repeated turns hit the server-side prompt cache
+MASTER_SYSTEM_BLOCKS = [
+    {"type": "text", "text": MASTER_SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}},
+]
+
+
+def _get_client(api_key: str | None) -> anthropic.Anthropic:
+    """Get the shared Anthropic client for an API key, creating it on first use."""
+    client = _clients.get(api_key)
+    if client is None:
+        client = _clients[api_key] = anthropic.Anthropic(api_key=api_key, max_retries=2)
+    return client
+
+
+@dataclass(slots=True)
+class _StreamState:
+    """Accumulated state for a single streamed LLM response."""
+    text_parts: list[str] = field(default_factory=list)
+    tool_calls: list[dict] = field(default_factory=list)
+    current_tool_call: dict | None = None
+    # Text streamed but not yet emitted; see MasterAgent._buffer_text
+    text_buf: list[str] = field(default_factory=list)
+    text_buf_len: int = 0
+    last_flush: float = 0.0
+
 
 class MasterAgent:
     """The master agent with streaming agentic loop."""
@@ -50,103 +103,213 @@ class MasterAgent:
         model: str = "claude-sonnet-4-20250514",
     ):
         self.federation = federation
-        self.client = anthropic.Anthropic(api_key=api_key)
+        self.client = _get_client(api_key)
         self.model = model
         self.tool_executor = ToolExecutor(federation)
         self.conversation: list[dict] = []
+        self._cached_block: dict | None = None  # Block carrying the rolling cache breakpoint
 
     def run(self, user_message: str) -> str:
         """Run the agentic loop for a user message. Returns final response."""
         self.federation.state.set_master_status(MasterStatus.THINKING)
         self.conversation.append({"role": "user", "content": user_message})
+        self._trim_conversation()
 
         final_response = ""
 
-        while True:
+        for _ in range(MAX_TURNS):
             response_text, tool_calls = self._call_llm_streaming()
 
-            if tool_calls:
-                # Build assistant message with text and tool use
-                assistant_content = []
-                if response_text:
-                    assistant_content.append({"type": "text", "text": response_text})
-                for tc in tool_calls:
-                    assistant_content.append({
-                        "type": "tool_use",
-                        "id": tc["id"],
-                        "name": tc["name"],
-                        "input": tc["input"],
-                    })
-
-                self.conversation.append({"role": "assistant", "content": assistant_content})
-
-                # Execute tools
-                tool_results = []
-                for tc in tool_calls:
-                    self.federation.state.set_master_status(MasterStatus.CALLING_TOOL, tc["name"])
-                    result = self.tool_executor.execute(tc["name"], tc["input"])
-                    tool_results.append({
-                        "type": "tool_result",
-                        "tool_use_id": tc["id"],
-                        "content": result,
-                    })
-
-                self.conversation.append({"role": "user", "content": tool_results})
-                self.federation.state.set_master_status(MasterStatus.THINKING)
-            else:
+            if not tool_calls:
                 final_response = response_text
                 if response_text:
                     self.conversation.append({"role": "assistant", "content": response_text})
-                self.federation.state.set_master_status(MasterStatus.IDLE)
-                self.federation.event_bus.emit(Event.create(EventType.MASTER_DONE))
                 break
 
+            self._append_tool_turns(response_text, tool_calls)
+        else:
+            final_response = response_text
+            self.federation.event_bus.status_update(
+                f"Master stopped after {MAX_TURNS} turns without a final response."
+            )
+
+        self.federation.state.set_master_status(MasterStatus.IDLE)
+        self.federation.event_bus.master_done()
         return final_response
 
     def _call_llm_streaming(self) -> tuple[str, list[dict]]:
-        """Call LLM with streaming, returning (text, tool_calls)."""
-        collected_text = ""
-        tool_calls = []
-        current_tool_call = None
-
-        with self.client.messages.stream(
-            model=self.model,
-            max_tokens=4096,
-            system=MASTER_SYSTEM_PROMPT,
-            messages=self.conversation,
-            tools=MASTER_TOOLS,
-        ) as stream:
-            for event in stream:
-                if event.type == "content_block_start":
-                    if hasattr(event.content_block, "type"):
-                        if event.content_block.type == "tool_use":
-                            current_tool_call = {
-                                "id": event.content_block.id,
-                                "name": event.content_block.name,
-                                "input": {},
-                                "_input_json": "",
-                            }
-
-                elif event.type == "content_block_delta":
-                    if hasattr(event.delta, "text"):
-                        text_chunk = event.delta.text
-                        collected_text += text_chunk
-                        self.federation.event_bus.master_text(text_chunk)
-                    elif hasattr(event.delta, "partial_json"):
-                        if current_tool_call:
-                            current_tool_call["_input_json"] += event.delta.partial_json
-
-                elif event.type == "content_block_stop":
-                    if current_tool_call:
-                        import json
-                        try:
-                            current_tool_call["input"] = json.loads(
-                                current_tool_call["_input_json"] or "{}"
-                            )
-                        except json.JSONDecodeError:
-                            current_tool_call["input"] = {}
-                        del current_tool_call["_input_json"]
-                        tool_calls.append(current_tool_call)
-                        current_tool_call = None
-
-        return collected_text, tool_calls
+        """Call LLM with streaming, returning (text, tool_calls).
+
+        Each tool call is executed as soon as its block is complete, so tool
+        work overlaps with the rest of the stream. The result is stored on
+        the tool call under "result".
+        """
+        stream_state = _StreamState()
+        handlers = self._STREAM_HANDLERS
+
+        # The socket is read on a separate thread so it keeps draining while
+        # events are handled here (including tool execution)
+        events: queue.SimpleQueue = queue.SimpleQueue()
+        stop = threading.Event()
+        threading.Thread(target=self._read_stream, args=(events, stop), daemon=True).start()
+
+        try:
+            while True:
+                event = events.get()
+                if event is _STREAM_END:
+                    break
+                if isinstance(event, Exception):
+                    raise event
+                handler = handlers.get(event.type)
+                if handler is not None:
+                    handler(self, event, stream_state)
+        except BaseException:
+            # Tools that already ran have had their side effects (workers spawned,
+            # completed results drained), so record them before propagating
+            if stream_state.tool_calls:
+                self._append_tool_turns("".join(stream_state.text_parts), stream_state.tool_calls)
+            raise
+        finally:
+            # If we stopped early, the reader closes the stream instead of draining it
+            stop.set()
+
+        self._flush_text(stream_state)
+        return "".join(stream_state.text_parts), stream_state.tool_calls
+
+    def _read_stream(self, events: queue.SimpleQueue, stop: threading.Event) -> None:
+        """Read the LLM stream into a queue, ending with _STREAM_END.
+
+        Stops reading (closing the stream) once stop is set.
+        """
+        try:
+            with self.client.messages.stream(
+                model=self.model,
+                max_tokens=4096,
+                system=MASTER_SYSTEM_BLOCKS,
+                messages=self.conversation,
+                tools=MASTER_TOOLS,
+            ) as stream:
+                for event in stream:
+                    if stop.is_set():
+                        break
+                    events.put(event)
+        except Exception as e:
+            events.put(e)
+        finally:
+            events.put(_STREAM_END)
+
+    def _on_block_start(self, event, stream_state: _StreamState) -> None:
+        block = event.content_block
+        if getattr(block, "type", None) == "tool_use":
+            stream_state.current_tool_call = {
+                "id": block.id,
+                "name": block.name,
+                "input": {},
+                "_input_json": [],
+            }
+
+    def _on_block_delta(self, event, stream_state: _StreamState) -> None:
+        delta = event.delta
+        text_chunk = getattr(delta, "text", None)
+        if text_chunk is not None:
+            stream_state.text_parts.append(text_chunk)
+            self._buffer_text(text_chunk, stream_state)
+        elif stream_state.current_tool_call:
+            partial_json = getattr(delta, "partial_json", None)
+            if partial_json is not None:
+                stream_state.current_tool_call["_input_json"].append(partial_json)
+
+    def _on_block_stop(self, event, stream_state: _StreamState) -> None:
+        self._flush_text(stream_state)
+        tool_call = stream_state.current_tool_call
+        if tool_call:
+            try:
+                tool_call["input"] = json_loads("".join(tool_call["_input_json"]) or "{}")
+            except json.JSONDecodeError:
+                tool_call["input"] = {}
+            del tool_call["_input_json"]
+            self._execute_tool_call(tool_call)
+            stream_state.tool_calls.append(tool_call)
+            stream_state.current_tool_call = None
+
+    # Stream event type -> handler; other event types are ignored
+    _STREAM_HANDLERS = {
+        "content_block_start": _on_block_start,
+        "content_block_delta": _on_block_delta,
+        "content_block_stop": _on_block_stop,
+    }
+
+    def _append_tool_turns(self, response_text: str, tool_calls: list[dict]) -> None:
+        """Append the assistant tool_use turn and the matching tool_result turn."""
+        # Build assistant message with text and tool use
+        assistant_content = [
+            {"type": "tool_use", "id": tc["id"], "name": tc["name"], "input": tc["input"]}
+            for tc in tool_calls
+        ]
+        if response_text:
+            assistant_content.insert(0, {"type": "text", "text": response_text})
+        self.conversation.append({"role": "assistant", "content": assistant_content})
+
+        # Tools were already executed while the stream was finishing
+        tool_results = [
+            {"type": "tool_result", "tool_use_id": tc["id"], "content": tc["result"]}
+            for tc in tool_calls
+        ]
+        self.conversation.append({"role": "user", "content": tool_results})
+        self._move_cache_breakpoint(tool_results[-1])
+
+    def _trim_conversation(self) -> None:
+        """Drop the oldest exchanges once the conversation grows past the limit.
+
+        Cuts only before a user text message, so tool_use/tool_result pairs stay intact.
+        """
+        conversation = self.conversation
+        if len(conversation) <= MAX_CONVERSATION_MESSAGES:
+            return
+        for i in range(len(conversation) - MAX_CONVERSATION_MESSAGES // 2, len(conversation)):
+            message = conversation[i]
+            if message["role"] == "user" and isinstance(message["content"], str):
+                del conversation[:i]
+                return
+
+    def _move_cache_breakpoint(self, block: dict) -> None:
+        """Mark block as the end of the cached conversation prefix.
+
+        Only the newest tool result carries the breakpoint, so each turn
+        reuses the cached prefix and the API's breakpoint limit is never hit.
+        """
+        if self._cached_block is not None:
+            self._cached_block.pop("cache_control", None)
+        block["cache_control"] = {"type": "ephemeral"}
+        self._cached_block = block
+
+    def _execute_tool_call(self, tool_call: dict) -> None:
+        """Execute a completed tool call and store its result on it."""
+        state = self.federation.state
+        state.set_master_status(MasterStatus.CALLING_TOOL, tool_call["name"])
+        tool_call["result"] = self.tool_executor.execute(tool_call["name"], tool_call["input"])
+        state.set_master_status(MasterStatus.THINKING)
+
+    def _buffer_text(self, text: str, stream_state: _StreamState) -> None:
+        """Buffer a streamed text chunk, flushing on size or time threshold.
+
+        The buffer lives on the stream's state, so text left over from a
+        failed stream is dropped with it rather than leaking into the next one.
+        """
+        stream_state.text_buf.append(text)
+        stream_state.text_buf_len += len(text)
+        if (
+            stream_state.text_buf_len >= TEXT_FLUSH_CHARS
+            or time.monotonic() - stream_state.last_flush >= TEXT_FLUSH_INTERVAL
+        ):
+            self._flush_text(stream_state)
+
+    def _flush_text(self, stream_state: _StreamState) -> None:
+        """Emit any buffered text as a single master_text event."""
+        stream_state.last_flush = time.monotonic()
+        if not stream_state.text_buf:
+            return
+        text = "".join(stream_state.text_buf)
+        stream_state.text_buf.clear()
+        stream_state.text_buf_len = 0
+        self.federation.event_bus.master_text(text)
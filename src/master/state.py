@@ -1,6 +1,9 @@
 """State management for the federation."""
 
-import uuid
+import secrets
+from collections.abc import Mapping
+from dataclasses import replace
+from types import MappingProxyType
 
 from ..shared.types import (
     FederationState,
@@ -18,37 +21,42 @@ class StateManager:
 
     def __init__(self, workspace_path: str = "./workspace"):
         self.state = FederationState(workspace_path=workspace_path)
+        self._completed_ids: set[str] = set()  # Membership index for completed_queue
+        self.worker_types_version = 0  # Bumped by add_worker_type, the only writer of worker_configs
         self._load_default_configs()
 
     def _load_default_configs(self) -> None:
         """Load default worker configurations."""
-        self.state.worker_configs["general"] = WorkerConfig(
+        self.add_worker_type(WorkerConfig(
             name="general",
             description="A general-purpose worker that can handle various tasks.",
             system_prompt="You are a helpful worker agent. Complete tasks thoroughly and clearly.",
             allowed_tools=["Read", "Write", "Edit", "Bash", "Glob", "Grep"],
-        )
+        ))
 
-        self.state.worker_configs["coder"] = WorkerConfig(
+        self.add_worker_type(WorkerConfig(
             name="coder",
             description="A coding specialist for writing and modifying code.",
             system_prompt="You are a coding agent. Write clean, well-structured code with good error handling.",
             allowed_tools=["Read", "Write", "Edit", "Bash", "Glob", "Grep"],
-        )
+        ))
 
-        self.state.worker_configs["researcher"] = WorkerConfig(
+        self.add_worker_type(WorkerConfig(
             name="researcher",
             description="A research agent for gathering and analyzing information.",
             system_prompt="You are a research agent. Gather information thoroughly and provide clear summaries.",
             allowed_tools=["Read", "Glob", "Grep", "WebFetch", "WebSearch"],
-        )
+        ))
 
     # --- Master state ---
 
     def set_master_status(self, status: MasterStatus, tool: str | None = None) -> None:
         """Update master agent status."""
-        self.state.master.status = status
-        self.state.master.current_tool = tool
+        master = self.state.master
+        if master.status is status and master.current_tool == tool:
+            return
+        master.status = status
+        master.current_tool = tool
 
     def get_master_state(self) -> MasterState:
         """Get current master state."""
@@ -56,9 +64,14 @@ class StateManager:
 
     # --- Worker configs ---
 
-    def list_worker_types(self) -> dict[str, WorkerConfig]:
-        """Get all available worker configurations."""
-        return self.state.worker_configs
+    def list_worker_types(self) -> Mapping[str, WorkerConfig]:
+        """Get all available worker configurations (read-only; use add_worker_type to change)."""
+        return MappingProxyType(self.state.worker_configs)
+
+    def add_worker_type(self, config: WorkerConfig) -> None:
+        """Register (or replace) a worker configuration."""
+        self.state.worker_configs[config.name] = config
+        self.worker_types_version += 1
 
     # --- Workers ---
 
@@ -76,11 +89,11 @@ class StateManager:
             raise ValueError(f"Unknown worker type: {worker_type}")
 
         config = self.state.worker_configs[worker_type]
-        worker_id = str(uuid.uuid4())[:8]
+        worker_id = secrets.token_hex(4)
 
         worker = Worker(
             id=worker_id,
-            type=worker_type,
+            type=config.name,  # Share the config's string rather than the tool input's
             config=config,
         )
         self.state.workers[worker_id] = worker
@@ -91,8 +104,7 @@ class StateManager:
         if worker_id in self.state.workers:
             del self.state.workers[worker_id]
             # Also remove from completed queue if present
-            if worker_id in self.state.completed_queue:
-                self.state.completed_queue.remove(worker_id)
+            self._dequeue_completed(worker_id)
             return True
         return False
 
@@ -130,7 +142,8 @@ class StateManager:
         worker.last_event_at = datetime.now()
 
         # Add to completed queue for master to pick up
-        if worker_id not in self.state.completed_queue:
+        if worker_id not in self._completed_ids:
+            self._completed_ids.add(worker_id)
             self.state.completed_queue.append(worker_id)
 
         return True
@@ -148,17 +161,20 @@ class StateManager:
         if not worker:
             return False
 
-        worker.status = WorkerStatus.IDLE
-        worker.current_task = None
-        worker.intention = None
-        worker.result = None
+        self._reset_worker(worker)
 
         # Remove from completed queue if present
-        if worker_id in self.state.completed_queue:
-            self.state.completed_queue.remove(worker_id)
+        self._dequeue_completed(worker_id)
 
         return True
 
+    def _reset_worker(self, worker: Worker) -> None:
+        """Put a worker back to idle, clearing its task and result."""
+        worker.status = WorkerStatus.IDLE
+        worker.current_task = None
+        worker.intention = None
+        worker.result = None
+
     # --- Completion queue ---
 
     def get_completed_workers(self) -> list[Worker]:
@@ -167,13 +183,37 @@ class StateManager:
             self.state.workers[wid]
             for wid in self.state.completed_queue
             if wid in self.state.workers
+            and self.state.workers[wid].status is WorkerStatus.DONE
         ]
 
+    def drain_completed(self) -> list[Worker]:
+        """Take all completed workers off the queue, resetting them to idle.
+
+        Returns snapshots of the workers as they were on completion.
+        """
+        completed = []
+        queue = self.state.completed_queue
+        while queue:
+            worker_id = queue.popleft()
+            self._completed_ids.discard(worker_id)
+            worker = self.state.workers.get(worker_id)
+            if worker and worker.status is WorkerStatus.DONE:
+                completed.append(replace(worker))
+                self._reset_worker(worker)
+        return completed
+
     def pop_completed(self) -> Worker | None:
         """Pop the next completed worker from the queue."""
         while self.state.completed_queue:
-            worker_id = self.state.completed_queue.pop(0)
+            worker_id = self.state.completed_queue.popleft()
+            self._completed_ids.discard(worker_id)
             worker = self.state.workers.get(worker_id)
-            if worker and worker.status == WorkerStatus.DONE:
+            if worker and worker.status is WorkerStatus.DONE:
                 return worker
         return None
+
+    def _dequeue_completed(self, worker_id: str) -> None:
+        """Remove a worker from the completed queue, if it is queued."""
+        if worker_id in self._completed_ids:
+            self._completed_ids.discard(worker_id)
+            self.state.completed_queue.remove(worker_id)
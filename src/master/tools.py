@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
-from typing import Any, TYPE_CHECKING
+import inspect
+from typing import Any, Callable, TYPE_CHECKING
 
-from ..shared.types import Intention
+from ..shared.types import Intention, WorkerStatus
 
 if TYPE_CHECKING:
     from ..federation import Federation
 
 
+# Intention value -> member, so invalid LLM input is a dict miss rather than an exception
+_INTENTION_BY_VALUE: dict[str, Intention] = {i.value: i for i in Intention}
+
+
 # Tool definitions for the master agent
 MASTER_TOOLS = [
     {
@@ -98,43 +103,64 @@ class ToolExecutor:
 
     def __init__(self, federation: Federation):
         self.federation = federation
+        # Tool name -> handler, resolved once
+        self._handlers: dict[str, Callable[..., str]] = {
+            tool["name"]: getattr(self, f"_tool_{tool['name']}") for tool in MASTER_TOOLS
+        }
+        # Handler signatures, for validating tool input before the call
+        self._signatures: dict[str, inspect.Signature] = {
+            name: inspect.signature(handler) for name, handler in self._handlers.items()
+        }
+        # (worker_types_version, rendered text) for list_worker_types
+        self._worker_types_cache: tuple[int, str] | None = None
 
     def execute(self, tool_name: str, tool_input: dict[str, Any]) -> str:
         """Execute a tool and return the result."""
         self.federation.event_bus.master_tool_call(tool_name, tool_input)
 
-        handler = getattr(self, f"_tool_{tool_name}", None)
+        handler = self._handlers.get(tool_name)
         if not handler:
             result = f"Unknown tool: {tool_name}"
         else:
-            result = handler(**tool_input)
+            try:
+                self._signatures[tool_name].bind(**tool_input)
+            except TypeError as e:
+                result = f"Invalid input for {tool_name}: {e}"
+            else:
+                # Errors raised inside the handler are real bugs and propagate
+                result = handler(**tool_input)
 
         self.federation.event_bus.master_tool_result(tool_name, result)
         return result
 
     def _tool_list_worker_types(self) -> str:
-        configs = self.federation.state.list_worker_types()
+        state = self.federation.state
+        cached = self._worker_types_cache
+        if cached and cached[0] == state.worker_types_version:
+            return cached[1]
+
+        configs = state.list_worker_types()
         if not configs:
-            return "No worker types available."
+            result = "No worker types available."
+        else:
+            result = "Available worker types:\n" + "\n".join(
+                f"\n- {name}: {config.description}" for name, config in configs.items()
+            )
 
-        lines = ["Available worker types:"]
-        for name, config in configs.items():
-            lines.append(f"\n- {name}: {config.description}")
-        return "\n".join(lines)
+        self._worker_types_cache = (state.worker_types_version, result)
+        return result
 
     def _tool_list_workers(self) -> str:
         workers = self.federation.state.list_workers()
         if not workers:
             return "No workers running."
 
-        lines = ["Current workers:"]
-        for worker_id, worker in workers.items():
-            lines.append(f"\n- {worker_id} ({worker.type}): {worker.status.value}")
-            if worker.current_task:
-                lines.append(f"  Task: {worker.current_task[:50]}...")
-            if worker.result:
-                lines.append(f"  Result available: yes")
-        return "\n".join(lines)
+        return "Current workers:\n" + "\n".join(
+            f"\n- {worker_id} ({worker.type}): {worker.status.value}"
+            + (f"\n  Task: {worker.current_task[:50]}..." if worker.current_task else "")
+            + ("\n  Result available: yes" if worker.result else "")
+            for worker_id, worker in workers.items()
+        )
 
     def _tool_spawn_worker(self, worker_type: str) -> str:
         try:
@@ -154,13 +180,12 @@ class ToolExecutor:
         if not worker:
             return f"Worker not found: {worker_id}"
 
-        if worker.status.value == "working":
+        if worker.status is WorkerStatus.WORKING:
             return f"Worker {worker_id} is already busy."
 
         # Parse intention
-        try:
-            intention_enum = Intention(intention)
-        except ValueError:
+        intention_enum = _INTENTION_BY_VALUE.get(intention)
+        if intention_enum is None:
             return f"Invalid intention: {intention}"
 
         # Assign the task
@@ -171,21 +196,18 @@ class ToolExecutor:
         return f"Delegated task to worker {worker_id}. Use get_completed to check when done."
 
     def _tool_get_completed(self) -> str:
-        completed = self.federation.state.get_completed_workers()
+        # Drained workers are reset so they can be reused
+        completed = self.federation.state.drain_completed()
         if not completed:
             return "No completed tasks."
 
-        lines = ["Completed tasks:"]
-        for worker in completed:
-            lines.append(f"\n- Worker {worker.id} ({worker.type}):")
-            lines.append(f"  Task: {worker.current_task}")
-            lines.append(f"  Intention: {worker.intention.value if worker.intention else 'none'}")
-            lines.append(f"  Result: {worker.result}")
-
-            # Clear the worker so it can be reused
-            self.federation.state.clear_worker(worker.id)
-
-        return "\n".join(lines)
+        return "Completed tasks:\n" + "\n".join(
+            f"\n- Worker {worker.id} ({worker.type}):"
+            f"\n  Task: {worker.current_task}"
+            f"\n  Intention: {worker.intention.value if worker.intention else 'none'}"
+            f"\n  Result: {worker.result}"
+            for worker in completed
+        )
 
     def _tool_terminate_worker(self, worker_id: str) -> str:
         if self.federation.state.terminate_worker(worker_id):
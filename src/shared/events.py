@@ -1,10 +1,19 @@
 """Event system for streaming status updates throughout the federation."""
 
+import functools
+import inspect
+import logging
+import threading
+import time
+import weakref
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Protocol
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 
 class EventType(Enum):
     # Master events
@@ -27,17 +36,64 @@ class EventType(Enum):
     STATUS_UPDATE = "status_update"
 
 
-@dataclass
+# EventType -> value string, avoiding the Enum .value descriptor on hot paths
+EVENT_TYPE_NAMES: dict[EventType, str] = {t: t.value for t in EventType}
+
+# Offset from the monotonic clock to wall-clock time, for Event.wallclock
+_EPOCH_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
+
+@dataclass(slots=True)
 class Event:
     """An event in the federation."""
     type: EventType
-    timestamp: datetime
+    timestamp: int  # time.monotonic_ns() at creation; see wallclock
     agent_id: str | None  # None for master events
     data: dict[str, Any]
 
     @classmethod
     def create(cls, type: EventType, agent_id: str | None = None, **data) -> "Event":
-        return cls(type=type, timestamp=datetime.now(), agent_id=agent_id, data=data)
+        return cls(type=type, timestamp=time.monotonic_ns(), agent_id=agent_id, data=data)
+
+    @property
+    def wallclock(self) -> datetime:
+        """The event's creation time as a local datetime."""
+        return datetime.fromtimestamp((self.timestamp + _EPOCH_OFFSET_NS) / 1e9)
+
+
+# Event types whose consecutive events from one source can be merged by joining their text.
+# Only MASTER_TEXT: it is a token stream its consumers buffer into lines. Each WORKER_TEXT
+# is a separate SDK block shown as its own line(s), so joining them would glue blocks together
+TEXT_EVENT_TYPES = frozenset({EventType.MASTER_TEXT})
+
+
+def coalesce_text_events(events: list[Event]) -> list[Event]:
+    """Merge runs of consecutive text events from the same source.
+
+    Ordering relative to other events is preserved, so a batch of streamed
+    chunks reaches handlers as one event without reordering tool calls etc.
+    """
+    merged: list[Event] = []
+    run: list[Event] = []
+    for event in events:
+        if run and (event.type is not run[0].type or event.agent_id != run[0].agent_id):
+            merged.append(_merge_text_run(run))
+            run = []
+        if event.type in TEXT_EVENT_TYPES:
+            run.append(event)
+        else:
+            merged.append(event)
+    if run:
+        merged.append(_merge_text_run(run))
+    return merged
+
+
+def _merge_text_run(run: list[Event]) -> Event:
+    if len(run) == 1:
+        return run[0]
+    first = run[0]
+    text = "".join(e.data.get("text", "") for e in run)
+    return Event(type=first.type, timestamp=first.timestamp, agent_id=first.agent_id, data={"text": text})
 
 
 class EventHandler(Protocol):
@@ -45,56 +101,197 @@ class EventHandler(Protocol):
     def __call__(self, event: Event) -> None: ...
 
 
+class BatchEventHandler(Protocol):
+    """Protocol for handlers that receive events in batches."""
+    def __call__(self, events: list[Event]) -> None: ...
+
+
+class WeakMethodHandler:
+    """Calls a bound-method handler without keeping its object alive."""
+
+    def __init__(self, method: EventHandler, on_dead: Any = None):
+        self._ref = weakref.WeakMethod(method, on_dead)
+
+    @property
+    def handler(self) -> EventHandler | None:
+        return self._ref()
+
+    @property
+    def alive(self) -> bool:
+        return self._ref() is not None
+
+    def __call__(self, event: Event) -> None:
+        method = self._ref()
+        if method is not None:
+            method(event)
+
+
+class QueuedHandler:
+    """Delivers batches of events to a handler from its own consumer thread.
+
+    emit() only appends to a deque and sets a wakeup flag (both atomic in
+    CPython), so producers such as the master's stream loop never wait on a
+    slow handler. Events are delivered in order; none are dropped.
+    """
+
+    def __init__(self, handler: BatchEventHandler):
+        self.handler = handler
+        self._queue: deque[Event] = deque()
+        self._nudge = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+
+    @property
+    def alive(self) -> bool:
+        return not self._closed and getattr(self.handler, "alive", True)
+
+    def __call__(self, event: Event) -> None:
+        self._queue.append(event)
+        self._nudge.set()
+
+    def close(self) -> None:
+        """Stop the consumer thread once pending events are delivered."""
+        self._closed = True
+        self._nudge.set()
+
+    def _drain(self) -> None:
+        while True:
+            self._nudge.wait()
+            self._nudge.clear()
+            while self._queue:
+                # Take everything queued so far; text that piled up while the
+                # handler was busy is delivered as one event per source
+                batch = coalesce_text_events(
+                    [self._queue.popleft() for _ in range(len(self._queue))]
+                )
+                try:
+                    self.handler(batch)
+                except Exception:
+                    # A failing handler must not stop delivery of later batches
+                    logger.exception("Event handler %r failed on a batch of %d events", self.handler, len(batch))
+            if self._closed:
+                return
+
+
+def _unwrap(handler: EventHandler) -> EventHandler | None:
+    """Get the handler originally passed to subscribe()."""
+    if isinstance(handler, QueuedHandler):
+        handler = handler.handler
+    if isinstance(handler, WeakMethodHandler):
+        return handler.handler
+    return handler
+
+
 class EventBus:
-    """Simple event bus for broadcasting events to handlers."""
+    """Simple event bus for broadcasting events to handlers.
+
+    Bound-method handlers are held weakly and dropped once their object is
+    garbage collected, so discarded UIs or test fixtures don't leak. Methods
+    of objects that can't be weakly referenced (e.g. __slots__ classes
+    without __weakref__) are held strongly instead.
+    """
 
     def __init__(self):
-        self._handlers: list[EventHandler] = []
+        # Immutable; replaced on (un)subscribe so emit() never needs a snapshot
+        self._handlers: tuple[EventHandler, ...] = ()
 
     def subscribe(self, handler: EventHandler) -> None:
-        self._handlers.append(handler)
+        self._handlers = self._handlers + (self._weaken(handler),)
+
+    def subscribe_batch(self, handler: BatchEventHandler) -> None:
+        """Subscribe a handler that receives lists of events.
+
+        The handler runs on its own consumer thread and is called once with
+        everything that queued up since its previous call.
+        """
+        self._handlers = self._handlers + (QueuedHandler(self._weaken(handler)),)
+
+    def _weaken(self, handler: EventHandler) -> EventHandler:
+        """Wrap a bound method so it's held weakly, if its object allows that."""
+        if inspect.ismethod(handler):
+            try:
+                return WeakMethodHandler(handler, lambda _ref: self._prune())
+            except TypeError:
+                pass  # Object doesn't support weak references; keep it strongly
+        return handler
+
+    def unsubscribe(self, handler: EventHandler | BatchEventHandler) -> None:
+        handlers = self._handlers
+        for i, h in enumerate(handlers):
+            if _unwrap(h) == handler:
+                # Remove only this subscription, like list.remove
+                self._handlers = handlers[:i] + handlers[i + 1:]
+                if isinstance(h, QueuedHandler):
+                    h.close()
+                return
+        raise ValueError(f"Handler not subscribed: {handler!r}")
 
-    def unsubscribe(self, handler: EventHandler) -> None:
-        self._handlers.remove(handler)
+    def _prune(self) -> None:
+        """Drop handlers whose objects have been garbage collected."""
+        dead = [h for h in self._handlers if not getattr(h, "alive", True)]
+        if not dead:
+            return
+        self._handlers = tuple(h for h in self._handlers if h not in dead)
+        for h in dead:
+            if isinstance(h, QueuedHandler):
+                h.close()
 
     def emit(self, event: Event) -> None:
-        for handler in self._handlers:
+        handlers = self._handlers
+        if len(handlers) == 1:
+            handlers[0](event)
+            return
+        for handler in handlers:
             handler(event)
 
     # Convenience methods for common events
     def master_text(self, text: str) -> None:
-        self.emit(Event.create(EventType.MASTER_TEXT, text=text))
+        self.emit(Event(EventType.MASTER_TEXT, time.monotonic_ns(), None, {"text": text}))
 
     def master_tool_call(self, tool_name: str, tool_input: dict) -> None:
-        self.emit(Event.create(EventType.MASTER_TOOL_CALL, tool_name=tool_name, tool_input=tool_input))
+        self.emit(Event(EventType.MASTER_TOOL_CALL, time.monotonic_ns(), None, {"tool_name": tool_name, "tool_input": tool_input}))
 
     def master_tool_result(self, tool_name: str, result: Any) -> None:
-        self.emit(Event.create(EventType.MASTER_TOOL_RESULT, tool_name=tool_name, result=result))
+        self.emit(Event(EventType.MASTER_TOOL_RESULT, time.monotonic_ns(), None, {"tool_name": tool_name, "result": result}))
+
+    def master_done(self) -> None:
+        self.emit(Event(EventType.MASTER_DONE, time.monotonic_ns(), None, {}))
 
     def worker_spawned(self, agent_id: str, agent_type: str) -> None:
-        self.emit(Event.create(EventType.WORKER_SPAWNED, agent_id=agent_id, agent_type=agent_type))
+        self.emit(Event(EventType.WORKER_SPAWNED, time.monotonic_ns(), agent_id, {"agent_type": agent_type}))
 
     def worker_started(self, agent_id: str, task: str) -> None:
-        self.emit(Event.create(EventType.WORKER_STARTED, agent_id=agent_id, task=task))
+        self.emit(Event(EventType.WORKER_STARTED, time.monotonic_ns(), agent_id, {"task": task}))
 
     def worker_text(self, agent_id: str, text: str) -> None:
-        self.emit(Event.create(EventType.WORKER_TEXT, agent_id=agent_id, text=text))
+        self.emit(Event(EventType.WORKER_TEXT, time.monotonic_ns(), agent_id, {"text": text}))
 
     def worker_tool_call(self, agent_id: str, tool_name: str, tool_input: dict) -> None:
-        self.emit(Event.create(EventType.WORKER_TOOL_CALL, agent_id=agent_id, tool_name=tool_name, tool_input=tool_input))
+        self.emit(Event(EventType.WORKER_TOOL_CALL, time.monotonic_ns(), agent_id, {"tool_name": tool_name, "tool_input": tool_input}))
 
     def worker_done(self, agent_id: str, result: str) -> None:
-        self.emit(Event.create(EventType.WORKER_DONE, agent_id=agent_id, result=result))
+        self.emit(Event(EventType.WORKER_DONE, time.monotonic_ns(), agent_id, {"result": result}))
 
     def status_update(self, message: str) -> None:
-        self.emit(Event.create(EventType.STATUS_UPDATE, message=message))
+        self.emit(Event(EventType.STATUS_UPDATE, time.monotonic_ns(), None, {"message": message}))
+
+
+# Console line prefixes per event type
+_CONSOLE_PREFIXES: dict[EventType, str] = {t: f"[{t.value}]" for t in EventType}
+
+
+@functools.lru_cache(maxsize=256)
+def _console_agent_prefix(type: EventType, agent_id: str) -> str:
+    return f"{_CONSOLE_PREFIXES[type]} [{agent_id}]"
 
 
 def console_event_handler(event: Event) -> None:
     """Simple console handler for debugging."""
-    prefix = f"[{event.type.value}]"
     if event.agent_id:
-        prefix += f" [{event.agent_id}]"
+        prefix = _console_agent_prefix(event.type, event.agent_id)
+    else:
+        prefix = _CONSOLE_PREFIXES[event.type]
 
     if event.type == EventType.MASTER_TEXT or event.type == EventType.WORKER_TEXT:
         print(f"{prefix} {event.data.get('text', '')}", end="", flush=True)
@@ -1,5 +1,6 @@
 """Core types for the agent federation system."""
 
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
@@ -23,7 +24,7 @@ class Intention(Enum):
     REVIEW_BY_MASTER = "review_by_master"
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkerConfig:
     """Configuration for a worker type."""
     name: str
@@ -32,7 +33,7 @@ class WorkerConfig:
     allowed_tools: list[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class Worker:
     """A worker agent in the federation."""
     id: str
@@ -50,18 +51,18 @@ class Worker:
     last_event_at: datetime | None = None  # Last event received
 
 
-@dataclass
+@dataclass(slots=True)
 class MasterState:
     """Current state of the master agent."""
     status: MasterStatus = MasterStatus.IDLE
     current_tool: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FederationState:
     """Global state of the federation."""
     master: MasterState = field(default_factory=MasterState)
     workers: dict[str, Worker] = field(default_factory=dict)
     worker_configs: dict[str, WorkerConfig] = field(default_factory=dict)
-    completed_queue: list[str] = field(default_factory=list)  # Worker IDs with results ready
+    completed_queue: deque[str] = field(default_factory=deque)  # Worker IDs with results ready
     workspace_path: str = "./workspace"
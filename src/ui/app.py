@@ -2,33 +2,95 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable
-from dataclasses import dataclass
+import functools
+from collections import deque
+from itertools import islice
+from typing import TYPE_CHECKING, Callable, Sequence
+from dataclasses import dataclass, field
 
 from textual.app import App, ComposeResult
 from textual.containers import Vertical, Container
 from textual.widgets import Header, Footer, Static, Input, RichLog, Label
 from textual.message import Message
 from textual import work
+from rich.style import Style, StyleType
 from rich.text import Text
 
-from ..shared.events import Event, EventType
-from ..shared.types import Worker
+from ..shared.events import EVENT_TYPE_NAMES, Event, EventType
+from ..shared.types import Worker, WorkerStatus
 
 if TYPE_CHECKING:
     from ..federation import Federation
 
 
-@dataclass
+# Styles parsed once; Text with a Style object skips the theme lookup and parse on render
+STYLE_WHITE = Style.parse("white")
+STYLE_BOLD = Style.parse("bold")
+STYLE_DIM = Style.parse("dim")
+STYLE_CYAN = Style.parse("cyan")
+STYLE_BLUE = Style.parse("blue")
+STYLE_GREEN = Style.parse("green")
+STYLE_YELLOW = Style.parse("yellow")
+STYLE_YELLOW_BOLD = Style.parse("yellow bold")
+STYLE_BOLD_GREEN = Style.parse("bold green")
+STYLE_RED_BOLD = Style.parse("red bold")
+
+# Constant log lines, built once and reused for every write
+CHAT_SEPARATOR = Text("─" * 20, style=STYLE_DIM)
+WORKER_DETAILS_PLACEHOLDER = Text("Select a worker to see details", style=STYLE_DIM)
+
+
+@functools.lru_cache(maxsize=128)
+def _tool_label(tool_name: str) -> Text:
+    """Chat log line for a master tool call, shared across calls to the same tool."""
+    return Text(f"[{tool_name}]", style=STYLE_CYAN)
+
+
+# Event log line prefix and color per event type (worker yellow, master cyan, others dim)
+EVENT_LOG_PREFIXES = {t: f"[{name}] " for t, name in EVENT_TYPE_NAMES.items()}
+EVENT_LOG_STYLES = {
+    t: STYLE_YELLOW if "worker" in name else STYLE_CYAN if "master" in name else STYLE_DIM
+    for t, name in EVENT_TYPE_NAMES.items()
+}
+
+# Per-status display: icon, workers list CSS class, and details style
+STATUS_ICONS = {WorkerStatus.IDLE: "○", WorkerStatus.WORKING: "●", WorkerStatus.DONE: "✓"}
+STATUS_CLASSES = {WorkerStatus.IDLE: "dim", WorkerStatus.WORKING: "yellow", WorkerStatus.DONE: "green"}
+STATUS_STYLES = {WorkerStatus.IDLE: STYLE_DIM, WorkerStatus.WORKING: STYLE_YELLOW, WorkerStatus.DONE: STYLE_GREEN}
+
+# Workers list refreshes are batched to at most one per this many seconds
+WORKERS_REFRESH_DELAY = 0.1
+
+# Marks a worker output replay whose oldest lines have been dropped
+WORKER_OUTPUT_TRUNCATED = Text("... (older output truncated) ...", style=STYLE_DIM)
+
+
+@dataclass(slots=True)
 class WorkerOutput:
     """Stores a single output line from a worker."""
     worker_id: str
     text: str
-    style: str = "white"
+    style: StyleType = STYLE_WHITE
+    # Rendered lines, built on first display and reused by later redraws
+    _prefixed: Text | None = field(default=None, repr=False, compare=False)
+    _plain: Text | None = field(default=None, repr=False, compare=False)
+
+    def render(self, prefixed: bool) -> Text:
+        """Get the display text, with the worker id prefix when prefixed."""
+        if prefixed:
+            if self._prefixed is None:
+                short_id = self.worker_id[:8] if self.worker_id else "???"
+                self._prefixed = Text(f"[{short_id}] {self.text}", style=self.style)
+            return self._prefixed
+        if self._plain is None:
+            self._plain = Text(self.text, style=self.style)
+        return self._plain
 
 
 class WorkerFilterChanged(Message):
     """Message sent when worker filter changes."""
+    __slots__ = ("worker_id",)  # Message itself is slotted, so this drops the instance __dict__
+
     def __init__(self, worker_id: str | None) -> None:
         self.worker_id = worker_id
         super().__init__()
@@ -60,13 +122,17 @@ class WorkersList(Static):
         super().__init__(*args, **kwargs)
         self._workers: dict[str, Worker] = {}
         self._selected_id: str | None = None
+        self._rows: list[tuple[str | None, str, str]] | None = None  # Rows currently mounted
+        self._items: dict[str | None, ClickableWorkerItem] = {}  # Mounted items by worker id
+        self._container: Vertical | None = None  # Set on mount
 
+    # Not named "workers": that would shadow Widget.workers (Textual's worker manager)
     @property
-    def workers(self) -> dict[str, Worker]:
+    def worker_data(self) -> dict[str, Worker]:
         return self._workers
 
-    @workers.setter
-    def workers(self, value: dict[str, Worker]) -> None:
+    @worker_data.setter
+    def worker_data(self, value: dict[str, Worker]) -> None:
         self._workers = value
         self._rebuild_list()
 
@@ -84,6 +150,7 @@ class WorkersList(Static):
 
     def on_mount(self) -> None:
         """Rebuild list once widget is mounted."""
+        self._container = self.query_one("#workers-container", Vertical)
         self._rebuild_list()
 
     def _handle_selection(self, worker_id: str | None) -> None:
@@ -102,31 +169,83 @@ class WorkersList(Static):
         self.post_message(WorkerFilterChanged(self._selected_id))
 
     def _rebuild_list(self) -> None:
-        """Rebuild the worker list."""
-        try:
-            container = self.query_one("#workers-container", Vertical)
-        except Exception:
+        """Rebuild the worker list, if what it shows has changed."""
+        container = self._container
+        if container is None:
             return  # Widget not mounted yet
 
+        rows = self._build_rows()
+        old_rows = self._rows
+        if rows == old_rows:
+            return  # Nothing visible changed; skip remounting every item
+        self._rows = rows
+
+        # Workers keep their order (new ones are appended), so patch the list
+        # in place: drop removed items, update changed ones, mount new ones
+        if old_rows and rows:
+            old = {row[0]: row for row in old_rows}
+            kept = sum(1 for row in rows if row[0] in old)
+            if all(row[0] in old for row in rows[:kept]):
+                self._patch_list(container, old, rows, kept)
+                return
+
         container.remove_children()
+        self._items = {}
 
-        if not self._workers:
+        if not rows:
             container.mount(Label("No workers yet", classes="dim"))
             return
 
+        self._items = {
+            worker_id: ClickableWorkerItem(worker_id, text, self._handle_selection, classes=classes)
+            for worker_id, text, classes in rows
+        }
+        container.mount_all(self._items.values())
+
+    def _patch_list(
+        self,
+        container: Vertical,
+        old: dict[str | None, tuple[str | None, str, str]],
+        rows: list[tuple[str | None, str, str]],
+        kept: int,
+    ) -> None:
+        """Apply row changes to the mounted items; rows[:kept] are already mounted."""
+        current = {row[0] for row in rows}
+        for worker_id in [wid for wid in self._items if wid not in current]:
+            self._items.pop(worker_id).remove()
+
+        for worker_id, text, classes in rows[:kept]:
+            if old[worker_id] != (worker_id, text, classes):
+                item = self._items[worker_id]
+                item.update(text)
+                item.set_classes(classes)
+
+        added = {
+            worker_id: ClickableWorkerItem(worker_id, text, self._handle_selection, classes=classes)
+            for worker_id, text, classes in rows[kept:]
+        }
+        if added:
+            self._items.update(added)
+            container.mount_all(added.values())
+
+    def _build_rows(self) -> list[tuple[str | None, str, str]]:
+        """Compute (worker_id, text, classes) for each list item."""
+        if not self._workers:
+            return []
+
         # Add "All workers" option
         all_selected = self._selected_id is None
         all_prefix = "▶ " if all_selected else "  "
         all_classes = "bold worker-item" if all_selected else "worker-item"
-        container.mount(ClickableWorkerItem(None, f"{all_prefix}◉ ALL WORKERS", self._handle_selection, classes=all_classes))
+        rows: list[tuple[str | None, str, str]] = [(None, f"{all_prefix}◉ ALL WORKERS", all_classes)]
 
         # Add each worker
         from datetime import datetime
         now = datetime.now()
         for worker_id, worker in self._workers.items():
             is_selected = self._selected_id == worker_id
-            icon = {"idle": "○", "working": "●", "done": "✓"}.get(worker.status.value, "?")
-            color = {"idle": "dim", "working": "yellow", "done": "green"}.get(worker.status.value, "")
+            icon = STATUS_ICONS[worker.status]
+            color = STATUS_CLASSES[worker.status]
             prefix = "▶ " if is_selected else "  "
 
             # Calculate timing info
@@ -144,13 +263,14 @@ class WorkersList(Static):
             timing = ""
             if running_time:
                 timing = f" ({running_time}"
-                if last_event and worker.status.value == "working":
+                if last_event and worker.status is WorkerStatus.WORKING:
                     timing += f"/{last_event}"
                 timing += ")"
 
             text = f"{prefix}{icon} {worker_id[:8]} {worker.type}{timing}"
             classes = f"{color} worker-item" if color else "worker-item"
-            container.mount(ClickableWorkerItem(worker_id, text, self._handle_selection, classes=classes))
+            rows.append((worker_id, text, classes))
+        return rows
 
     def _format_duration(self, seconds: float) -> str:
         """Format a duration in seconds to a human-readable string."""
@@ -171,6 +291,7 @@ class WorkerDetails(Static):
         super().__init__(*args, **kwargs)
         self._worker: Worker | None = None
         self._worker_id: str | None = None
+        self._last_key: tuple | None = ()  # Fields last displayed; () forces the first render
 
     def set_worker(self, worker_id: str, worker: Worker) -> None:
         """Update the displayed worker."""
@@ -185,39 +306,46 @@ class WorkerDetails(Static):
         self._refresh_display()
 
     def _refresh_display(self) -> None:
-        """Rebuild the display."""
-        if self._worker is None:
-            self.update("[dim]Select a worker to see details[/dim]")
+        """Rebuild the display, if any displayed field changed."""
+        w = self._worker
+        key = None if w is None else (
+            self._worker_id, w.type, w.status, w.current_task, w.intention, w.config,
+        )
+        if key == self._last_key:
             return
+        self._last_key = key
 
-        w = self._worker
+        if w is None:
+            self.update(WORKER_DETAILS_PLACEHOLDER)
+            return
+
+        # Built as Text directly, so no markup is parsed (task text is shown verbatim)
         lines = []
 
         # Header with ID and type
-        status_icon = {"idle": "○", "working": "●", "done": "✓"}.get(w.status.value, "?")
-        status_color = {"idle": "dim", "working": "yellow", "done": "green"}.get(w.status.value, "white")
-        lines.append(f"[bold]{w.type}[/bold] [{status_color}]{status_icon} {w.status.value}[/{status_color}]")
-        lines.append(f"[dim]ID:[/dim] {self._worker_id}")
+        status_label = f"{STATUS_ICONS[w.status]} {w.status.value}"
+        lines.append(Text.assemble((w.type, STYLE_BOLD), " ", (status_label, STATUS_STYLES[w.status])))
+        lines.append(Text.assemble(("ID:", STYLE_DIM), f" {self._worker_id}"))
 
         # Task
         if w.current_task:
             task_display = w.current_task[:80] + "..." if len(w.current_task) > 80 else w.current_task
-            lines.append(f"[dim]Task:[/dim] {task_display}")
+            lines.append(Text.assemble(("Task:", STYLE_DIM), f" {task_display}"))
 
         # Intention
         if w.intention:
-            lines.append(f"[dim]On complete:[/dim] {w.intention.value}")
+            lines.append(Text.assemble(("On complete:", STYLE_DIM), f" {w.intention.value}"))
 
         # Tools
         if w.config and w.config.allowed_tools:
             tools = ", ".join(w.config.allowed_tools)
-            lines.append(f"[dim]Tools:[/dim] {tools}")
+            lines.append(Text.assemble(("Tools:", STYLE_DIM), f" {tools}"))
 
         # Description from config
         if w.config and w.config.description:
-            lines.append(f"[dim]Desc:[/dim] {w.config.description}")
+            lines.append(Text.assemble(("Desc:", STYLE_DIM), f" {w.config.description}"))
 
-        self.update("\n".join(lines))
+        self.update(Text("\n").join(lines))
 
 
 class StreamingLog(RichLog):
@@ -227,20 +355,23 @@ class StreamingLog(RichLog):
         super().__init__(*args, **kwargs)
         self._buffer = ""
 
-    def write_streaming(self, text: str, style: str = "white") -> None:
+    def write_streaming(self, text: str, style: StyleType = STYLE_WHITE) -> None:
         """Write streaming text, only outputting complete lines."""
-        self._buffer += text
+        if "\n" not in text:
+            self._buffer += text
+            return
 
-        # Output complete lines
-        while "\n" in self._buffer:
-            line, self._buffer = self._buffer.split("\n", 1)
-            if line:  # Don't write empty lines
-                self.write(Text(line, style=style))
+        # Output all complete lines in one write; the partial tail stays buffered
+        lines = (self._buffer + text).split("\n")
+        self._buffer = lines.pop()
+        complete = [Text(line, style=style) for line in lines if line]  # Don't write empty lines
+        if complete:
+            self.write(Text("\n").join(complete))
 
     def flush_buffer(self) -> None:
         """Flush any remaining buffered text."""
         if self._buffer:
-            self.write(Text(self._buffer, style="white"))
+            self.write(Text(self._buffer, style=STYLE_WHITE))
             self._buffer = ""
 
 
@@ -353,12 +484,36 @@ class FederationApp(App):
         ("escape", "show_all_workers", "Show All"),
     ]
 
+    # Worker output lines retained across all workers; older lines are dropped
+    MAX_OUTPUT_LINES = 10000
+    # Event log lines kept; the log is a live trace, not a history
+    MAX_EVENT_LOG_LINES = 5000
+    # Chat log lines kept; the conversation itself lives in MasterAgent
+    MAX_CHAT_LOG_LINES = 5000
+
     def __init__(self, federation: Federation) -> None:
         super().__init__()
         self.federation = federation
-        # Store all worker output for filtering
-        self.all_worker_output: list[WorkerOutput] = []
+        # Store all worker output for filtering, plus a per-worker index for filtered redraws
+        self.all_worker_output: deque[WorkerOutput] = deque()  # Capped by _store_outputs
+        self.worker_outputs: dict[str, deque[WorkerOutput]] = {}
+        # Whether lines have been dropped from all_worker_output / a worker's history
+        self._output_dropped = False
+        self._dropped_workers: set[str] = set()
         self.filter_worker_id: str | None = None
+        self._workers_refresh_pending = False
+        # Event type -> handler; types without one (e.g. MASTER_TOOL_RESULT) are only logged
+        self._event_handlers: dict[EventType, Callable[[Event], None]] = {
+            EventType.MASTER_TEXT: self._on_master_text,
+            EventType.MASTER_TOOL_CALL: self._on_master_tool_call,
+            EventType.MASTER_DONE: self._on_master_done,
+            EventType.WORKER_SPAWNED: self._on_worker_spawned,
+            EventType.WORKER_STARTED: self._on_worker_started,
+            EventType.WORKER_TEXT: self._on_worker_text,
+            EventType.WORKER_TOOL_CALL: self._on_worker_tool_call,
+            EventType.WORKER_DONE: self._on_worker_done,
+            EventType.STATUS_UPDATE: self._on_status_update,
+        }
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -366,7 +521,12 @@ class FederationApp(App):
         # Left column: Chat with master
         with Vertical(id="chat-area"):
             yield Label("Chat with Master", classes="section-title")
-            yield StreamingLog(id="chat-log", highlight=True, markup=True)
+            yield StreamingLog(
+                id="chat-log",
+                highlight=True,
+                markup=True,
+                max_lines=self.MAX_CHAT_LOG_LINES,
+            )
             yield Input(placeholder="Message to master...", id="chat-input")
 
         # Middle column: Workers, Details, Output
@@ -384,12 +544,24 @@ class FederationApp(App):
             # Worker output
             with Vertical(id="worker-output-area"):
                 yield Label("Worker Output", id="filter-label")
-                yield RichLog(id="worker-output", highlight=True, markup=True, wrap=False)
+                yield RichLog(
+                    id="worker-output",
+                    highlight=True,
+                    markup=True,
+                    wrap=False,
+                    max_lines=self.MAX_OUTPUT_LINES,
+                )
 
         # Right column: Event log
         with Vertical(id="event-log-area"):
             yield Label("Event Log", classes="section-title")
-            yield RichLog(id="event-log", highlight=True, markup=True, wrap=False)
+            yield RichLog(
+                id="event-log",
+                highlight=True,
+                markup=True,
+                wrap=False,
+                max_lines=self.MAX_EVENT_LOG_LINES,
+            )
 
         yield Footer()
 
@@ -405,28 +577,32 @@ class FederationApp(App):
         self.worker_details = self.query_one("#worker-details", WorkerDetails)
         self.filter_label = self.query_one("#filter-label", Label)
 
-        # Subscribe to events
-        self.federation.event_bus.subscribe(self.handle_event)
+        # Subscribe to events in batches, so emitting threads never wait on the
+        # UI and each batch costs a single hop onto the UI thread
+        self.federation.event_bus.subscribe_batch(self.handle_events)
 
         # Load initial workers
-        self._refresh_workers()
+        self._do_refresh_workers()
 
-        self.chat_log.write(Text("Ready. Type a message to begin.", style="dim"))
+        self.chat_log.write(Text("Ready. Type a message to begin.", style=STYLE_DIM))
 
     def on_worker_filter_changed(self, message: WorkerFilterChanged) -> None:
         """Handle worker filter change."""
-        self.filter_worker_id = message.worker_id
-        self._update_filter_label()
-        self._update_worker_details()
-        self._redraw_worker_output()
+        self._apply_filter(message.worker_id)
 
     def action_show_all_workers(self) -> None:
         """Show output from all workers."""
-        self.filter_worker_id = None
-        self.workers_list.selected_id = None
-        self._update_filter_label()
-        self._update_worker_details()
-        self._redraw_worker_output()
+        with self.batch_update():
+            self.workers_list.selected_id = None
+            self._apply_filter(None)
+
+    def _apply_filter(self, worker_id: str | None) -> None:
+        """Switch the worker output filter, repainting the affected panels once."""
+        self.filter_worker_id = worker_id
+        with self.batch_update():
+            self._update_filter_label()
+            self._update_worker_details()
+            self._redraw_worker_output()
 
     def _update_worker_details(self) -> None:
         """Update the worker details panel based on current selection."""
@@ -448,138 +624,201 @@ class FederationApp(App):
         """Redraw the worker output panel with current filter."""
         self.worker_output.clear()
 
-        for output in self.all_worker_output:
-            if self.filter_worker_id is None or output.worker_id == self.filter_worker_id:
-                self._write_worker_line(output)
+        if self.filter_worker_id is None:
+            history = self.all_worker_output
+            dropped = self._output_dropped
+        else:
+            history = self.worker_outputs.get(self.filter_worker_id, ())
+            dropped = self.filter_worker_id in self._dropped_workers
+
+        # Replay the whole history as one multi-line write. After a truncation
+        # marker only MAX_OUTPUT_LINES - 1 lines fit, or the log would trim the marker
+        start = max(0, len(history) - (self.MAX_OUTPUT_LINES - 1)) if dropped else 0
+        lines = [self._format_worker_line(output) for output in islice(history, start, None)]
+        if dropped:
+            lines.insert(0, WORKER_OUTPUT_TRUNCATED)
+        if lines:
+            self.worker_output.write(Text("\n").join(lines))
 
     def _write_worker_line(self, output: WorkerOutput) -> None:
         """Write a single worker output line."""
-        short_id = output.worker_id[:8] if output.worker_id else "???"
+        self.worker_output.write(self._format_worker_line(output))
+
+    def _format_worker_line(self, output: WorkerOutput) -> Text:
+        """Build the display text for a worker output line."""
         # Only show prefix if showing all workers
-        if self.filter_worker_id is None:
-            self.worker_output.write(Text(f"[{short_id}] {output.text}", style=output.style))
-        else:
-            self.worker_output.write(Text(output.text, style=output.style))
+        return output.render(prefixed=self.filter_worker_id is None)
 
-    def _add_worker_output(self, worker_id: str, text: str, style: str = "white") -> None:
+    def _add_worker_output(self, worker_id: str, text: str, style: StyleType = STYLE_WHITE) -> None:
         """Add worker output and display if matches filter."""
         output = WorkerOutput(worker_id=worker_id, text=text, style=style)
-        self.all_worker_output.append(output)
+        self._store_outputs(worker_id, (output,))
 
         # Display if matches current filter
         if self.filter_worker_id is None or self.filter_worker_id == worker_id:
             self._write_worker_line(output)
 
-    def handle_event(self, event: Event) -> None:
-        """Handle events from the federation."""
-        self.call_from_thread(self._process_event, event)
+    def _add_worker_output_lines(
+        self, worker_id: str, lines: list[str], style: StyleType = STYLE_WHITE
+    ) -> None:
+        """Add several worker output lines, displaying them in one write."""
+        outputs = [WorkerOutput(worker_id=worker_id, text=line, style=style) for line in lines]
+        self._store_outputs(worker_id, outputs)
+
+        # Display if matches current filter
+        if self.filter_worker_id is None or self.filter_worker_id == worker_id:
+            self.worker_output.write(Text("\n").join(self._format_worker_line(o) for o in outputs))
+
+    def _store_outputs(self, worker_id: str, outputs: Sequence[WorkerOutput]) -> None:
+        """Append output to the shared and per-worker histories.
+
+        The per-worker deques index the shared history: a line evicted from
+        all_worker_output is also removed from its worker's deque, so
+        MAX_OUTPUT_LINES bounds the total across all workers.
+        """
+        shared = self.all_worker_output
+        history = self._worker_history(worker_id)
+        for output in outputs:
+            if len(shared) >= self.MAX_OUTPUT_LINES:
+                evicted = shared.popleft()
+                self._output_dropped = True
+                evicted_history = self.worker_outputs.get(evicted.worker_id)
+                if evicted_history:
+                    evicted_history.popleft()  # Its oldest line is the one evicted
+                    self._dropped_workers.add(evicted.worker_id)
+            shared.append(output)
+            history.append(output)
+
+    def _worker_history(self, worker_id: str) -> deque[WorkerOutput]:
+        """Get the output history for one worker, creating it if needed."""
+        history = self.worker_outputs.get(worker_id)
+        if history is None:
+            history = self.worker_outputs[worker_id] = deque()
+        return history
+
+    def handle_events(self, events: list[Event]) -> None:
+        """Handle a batch of events from the federation."""
+        self.call_from_thread(self._process_events, events)
+
+    def _process_events(self, events: list[Event]) -> None:
+        """Process a batch of events on the main thread."""
+        # Suspend repaints so the whole batch costs one screen update
+        with self.batch_update():
+            log_lines = []
+            for event in events:
+                # Always log to event log
+                line = self._format_log_line(event)
+                if line is not None:
+                    log_lines.append(line)
+                self._process_event(event)
+
+            # One event-log write for the whole batch
+            if log_lines:
+                self.event_log.write(Text("\n").join(log_lines))
 
     def _process_event(self, event: Event) -> None:
-        """Process event on the main thread."""
-        # Always log to event log
-        self._log_event(event)
-
-        # Route by event type
-        if event.type == EventType.MASTER_TEXT:
-            text = event.data.get("text", "")
-            if text:
-                self.chat_log.write_streaming(text, style="white")
-
-        elif event.type == EventType.MASTER_TOOL_CALL:
-            tool_name = event.data.get("tool_name", "unknown")
-            self.chat_log.flush_buffer()
-            self.chat_log.write(Text(f"[{tool_name}]", style="cyan"))
-
-        elif event.type == EventType.MASTER_TOOL_RESULT:
-            pass  # Just logged in event log
-
-        elif event.type == EventType.MASTER_DONE:
-            self.chat_log.flush_buffer()
-            self.chat_log.write(Text("─" * 20, style="dim"))
-
-        elif event.type == EventType.WORKER_SPAWNED:
-            self._refresh_workers()
-            agent_type = event.data.get("agent_type", "")
-            agent_id = event.agent_id or ""
-            self.chat_log.flush_buffer()
-            self.chat_log.write(Text(f">> Spawned {agent_type}: {agent_id[:8]}", style="blue"))
-
-        elif event.type == EventType.WORKER_STARTED:
-            agent_id = event.agent_id or ""
-            self.federation.state.update_worker_event_time(agent_id)
-            self._refresh_workers()
-            self._add_worker_output(agent_id, f"─── started ───", style="yellow bold")
-
-        elif event.type == EventType.WORKER_TEXT:
-            agent_id = event.agent_id or ""
-            self.federation.state.update_worker_event_time(agent_id)
-            self._refresh_workers()  # Update timing display
-            text = event.data.get("text", "")
-            if text:
-                # Handle multi-line text
-                for line in text.split("\n"):
-                    if line:
-                        self._add_worker_output(agent_id, line, style="white")
-
-        elif event.type == EventType.WORKER_TOOL_CALL:
-            agent_id = event.agent_id or ""
-            tool_name = event.data.get("tool_name", "")
-            self.federation.state.update_worker_event_time(agent_id)
-            self._refresh_workers()  # Update timing display
-            self._add_worker_output(agent_id, f"[calling {tool_name}]", style="cyan")
-
-        elif event.type == EventType.WORKER_DONE:
-            agent_id = event.agent_id or ""
-            self.federation.state.update_worker_event_time(agent_id)
-            self._refresh_workers()
-            self._add_worker_output(agent_id, f"─── done ───", style="green")
-            self.chat_log.flush_buffer()
-            self.chat_log.write(Text(f">> Worker {agent_id[:8]} completed", style="green"))
-
-        elif event.type == EventType.STATUS_UPDATE:
-            msg = event.data.get("message", "")
-            self.chat_log.flush_buffer()
-            self.chat_log.write(Text(f">> {msg}", style="blue"))
+        """Route an event to its handler on the main thread."""
+        handler = self._event_handlers.get(event.type)
+        if handler is not None:
+            handler(event)
+
+    def _on_master_text(self, event: Event) -> None:
+        text = event.data.get("text", "")
+        if text:
+            self.chat_log.write_streaming(text, style=STYLE_WHITE)
+
+    def _on_master_tool_call(self, event: Event) -> None:
+        tool_name = event.data.get("tool_name", "unknown")
+        self.chat_log.flush_buffer()
+        self.chat_log.write(_tool_label(tool_name))
+
+    def _on_master_done(self, event: Event) -> None:
+        self.chat_log.flush_buffer()
+        self.chat_log.write(CHAT_SEPARATOR)
+
+    def _on_worker_spawned(self, event: Event) -> None:
+        self._refresh_workers()
+        agent_type = event.data.get("agent_type", "")
+        agent_id = event.agent_id or ""
+        self.chat_log.flush_buffer()
+        self.chat_log.write(Text(f">> Spawned {agent_type}: {agent_id[:8]}", style=STYLE_BLUE))
+
+    def _on_worker_started(self, event: Event) -> None:
+        agent_id = event.agent_id or ""
+        self.federation.state.update_worker_event_time(agent_id)
+        self._refresh_workers()
+        self._add_worker_output(agent_id, f"─── started ───", style=STYLE_YELLOW_BOLD)
+
+    def _on_worker_text(self, event: Event) -> None:
+        agent_id = event.agent_id or ""
+        self.federation.state.update_worker_event_time(agent_id)
+        self._refresh_workers()  # Update timing display
+        text = event.data.get("text", "")
+        if text:
+            # Handle multi-line text
+            lines = [line for line in text.split("\n") if line]
+            if lines:
+                self._add_worker_output_lines(agent_id, lines, style=STYLE_WHITE)
+
+    def _on_worker_tool_call(self, event: Event) -> None:
+        agent_id = event.agent_id or ""
+        tool_name = event.data.get("tool_name", "")
+        self.federation.state.update_worker_event_time(agent_id)
+        self._refresh_workers()  # Update timing display
+        self._add_worker_output(agent_id, f"[calling {tool_name}]", style=STYLE_CYAN)
+
+    def _on_worker_done(self, event: Event) -> None:
+        agent_id = event.agent_id or ""
+        self.federation.state.update_worker_event_time(agent_id)
+        self._refresh_workers()
+        self._add_worker_output(agent_id, f"─── done ───", style=STYLE_GREEN)
+        self.chat_log.flush_buffer()
+        self.chat_log.write(Text(f">> Worker {agent_id[:8]} completed", style=STYLE_GREEN))
+
+    def _on_status_update(self, event: Event) -> None:
+        msg = event.data.get("message", "")
+        self.chat_log.flush_buffer()
+        self.chat_log.write(Text(f">> {msg}", style=STYLE_BLUE))
 
     def _refresh_workers(self) -> None:
+        """Schedule a refresh of the workers list, coalescing bursts of events."""
+        if self._workers_refresh_pending:
+            return
+        self._workers_refresh_pending = True
+        self.set_timer(WORKERS_REFRESH_DELAY, self._do_refresh_workers)
+
+    def _do_refresh_workers(self) -> None:
         """Refresh the workers list and details."""
+        self._workers_refresh_pending = False
         workers = dict(self.federation.state.list_workers())
-        self.workers_list.workers = workers
+        self.workers_list.worker_data = workers
+        # Forget the per-worker index for terminated workers (their lines stay in the ALL view)
+        for worker_id in self.worker_outputs.keys() - workers.keys():
+            if worker_id != self.filter_worker_id:
+                del self.worker_outputs[worker_id]
+                self._dropped_workers.discard(worker_id)
         # Also refresh details if a worker is selected (status may have changed)
         if self.filter_worker_id:
             self._update_worker_details()
 
-    def _log_event(self, event: Event) -> None:
-        """Log event to the event log."""
+    def _format_log_line(self, event: Event) -> Text | None:
+        """Format an event for the event log, or None if it can't be formatted."""
         try:
-            event_type = event.type.value
-            agent_id = event.agent_id[:8] if event.agent_id else ""
-
             # Format data compactly
-            data_parts = []
-            for k, v in event.data.items():
-                v_str = str(v)
-                if len(v_str) > 30:
-                    v_str = v_str[:27] + "..."
-                data_parts.append(f"{k}={v_str}")
-            data_str = " ".join(data_parts) if data_parts else ""
-
-            # Color code by event type
-            if "worker" in event_type:
-                style = "yellow"
-            elif "master" in event_type:
-                style = "cyan"
-            else:
-                style = "dim"
+            data_str = " ".join(
+                f"{k}={v_str[:27] + '...' if len(v_str := str(v)) > 30 else v_str}"
+                for k, v in event.data.items()
+            )
 
-            if agent_id:
-                line = f"[{event_type}] {agent_id} {data_str}"
+            prefix = EVENT_LOG_PREFIXES[event.type]
+            if event.agent_id:
+                line = f"{prefix}{event.agent_id[:8]} {data_str}"
             else:
-                line = f"[{event_type}] {data_str}"
+                line = f"{prefix}{data_str}"
 
-            self.event_log.write(Text(line, style=style))
+            return Text(line, style=EVENT_LOG_STYLES[event.type], no_wrap=True)
         except Exception:
-            pass
+            return None
 
     async def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle user input."""
@@ -589,7 +828,7 @@ class FederationApp(App):
 
         event.input.value = ""
         self.chat_log.flush_buffer()
-        self.chat_log.write(Text(f"> {message}", style="bold green"))
+        self.chat_log.write(Text(f"> {message}", style=STYLE_BOLD_GREEN))
         self.run_master(message)
 
     @work(thread=True, exclusive=True)
@@ -600,7 +839,7 @@ class FederationApp(App):
         except Exception as e:
             self.call_from_thread(
                 self.chat_log.write,
-                Text(f"[ERROR] {e}", style="red bold")
+                Text(f"[ERROR] {e}", style=STYLE_RED_BOLD)
             )
 
     def action_clear(self) -> None:
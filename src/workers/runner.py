@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import threading
+from concurrent.futures import Future
 import traceback
 from typing import TYPE_CHECKING
 
@@ -40,36 +41,38 @@ except ImportError:
 
 
 class WorkerRunner:
-    """Runs workers in background threads using Claude Agent SDK."""
+    """Runs workers as tasks on a shared background event loop using Claude Agent SDK."""
 
     def __init__(self, federation: Federation):
         self.federation = federation
-        self._threads: dict[str, threading.Thread] = {}
+        self._tasks: dict[str, Future] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None  # Started on first worker
 
     def start_worker(self, worker_id: str, task: str) -> None:
-        """Start a worker in a background thread."""
+        """Start a worker on the background event loop."""
         worker = self.federation.state.get_worker(worker_id)
         if not worker:
             return
 
-        # Run in background thread
-        thread = threading.Thread(
-            target=self._run_worker_sync,
-            args=(worker_id, task, worker.config.system_prompt, worker.config.allowed_tools),
-            daemon=True,
+        future = asyncio.run_coroutine_threadsafe(
+            self._run_worker_async(worker_id, task, worker.config.system_prompt, worker.config.allowed_tools),
+            self._get_loop(),
         )
-        self._threads[worker_id] = thread
-        thread.start()
-
-    def _run_worker_sync(
-        self,
-        worker_id: str,
-        task: str,
-        system_prompt: str,
-        allowed_tools: list[str],
-    ) -> None:
-        """Synchronous wrapper to run async worker code."""
-        asyncio.run(self._run_worker_async(worker_id, task, system_prompt, allowed_tools))
+        self._tasks[worker_id] = future
+        future.add_done_callback(lambda f: self._forget(worker_id, f))
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the event loop all workers share, starting its thread on first use."""
+        if self._loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="workers", daemon=True).start()
+            self._loop = loop
+        return self._loop
+
+    def _forget(self, worker_id: str, future: Future) -> None:
+        """Clean up a finished worker's task reference."""
+        if self._tasks.get(worker_id) is future:
+            del self._tasks[worker_id]
 
     async def _run_worker_async(
         self,
@@ -160,8 +163,3 @@ class WorkerRunner:
             events.worker_text(worker_id, f"\n[ERROR] {error_msg}\n")
             state.complete_task(worker_id, error_msg)
             events.worker_done(worker_id, error_msg)
-
-        finally:
-            # Clean up thread reference
-            if worker_id in self._threads:
-                del self._threads[worker_id]